@@ -166,9 +166,7 @@ async def async_migrate_entry(  # noqa: PLR0911, PLR0912, PLR0915
                 logger=LOGGER,
                 session=async_get_clientsession(hass),
             )
-            printer = await hass.async_add_executor_job(
-                client.discover_printer, ip_address
-            )
+            printer = await client.discover_printer(ip_address)
             if printer and len(printer) > 0:
                 printer[0].proxy_enabled = proxy_enabled
                 new_data = printer[0].to_dict()
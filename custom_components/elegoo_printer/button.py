@@ -55,9 +55,9 @@ class ElegooSimpleButton(ElegooPrinterEntity, ButtonEntity):
         """  # noqa: E501
         super().__init__(coordinator)
         self.entity_description: ElegooPrinterButtonEntityDescription = description
-        self._elegoo_printer_client: ElegooPrinterClient = (
-            coordinator.config_entry.runtime_data.api.client
-        )
+        self._elegoo_printer_client: ElegooPrinterClient = coordinator.printer_client
+        # Bound once; available is polled on every state write
+        self._available_fn = description.available_fn
         # Set a unique ID and a friendly name for the entity
         self._attr_unique_id = coordinator.generate_unique_id(
             self.entity_description.key
@@ -78,4 +78,4 @@ class ElegooSimpleButton(ElegooPrinterEntity, ButtonEntity):
         """Return whether the button entity is currently available."""
         if not super().available:
             return False
-        return self.entity_description.available_fn(self._elegoo_printer_client)
+        return self._available_fn(self._elegoo_printer_client)
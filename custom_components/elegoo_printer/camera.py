@@ -1,26 +1,37 @@
 """Camera platform for Elegoo printer."""
 
+import asyncio
+import shlex
+import time
 from http import HTTPStatus
 from typing import TYPE_CHECKING
 
-from aiohttp import web
+import aiohttp
+from aiohttp import hdrs, web
 from haffmpeg.camera import CameraMjpeg
 from homeassistant.components.camera import Camera, CameraEntityFeature
 from homeassistant.components.ffmpeg import (
     DOMAIN,
     async_get_image,
 )
-from homeassistant.components.mjpeg.camera import MjpegCamera
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_aiohttp_proxy_stream
+from homeassistant.helpers.aiohttp_client import (
+    async_aiohttp_proxy_stream,
+    async_get_clientsession,
+)
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from propcache.api import cached_property
 
 from custom_components.elegoo_printer.const import (
     CONF_CAMERA_ENABLED,
     CONF_PROXY_ENABLED,
+    FFMPEG_INPUT_ARGUMENTS,
     LOGGER,
+    MJPEG_FRAME_TIMEOUT,
+    MJPEG_MAX_FRAME_SIZE,
+    MJPEG_VIEWER_QUEUE_SIZE,
     PROXY_HOST,
+    URL_CACHE_TTL,
     VIDEO_ENDPOINT,
     WEBSOCKET_PORT,
 )
@@ -42,6 +53,8 @@ from .coordinator import ElegooDataUpdateCoordinator
 if TYPE_CHECKING:
     from custom_components.elegoo_printer.websocket.client import ElegooPrinterClient
 
+MJPEG_BOUNDARY = "frameboundary"
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -52,19 +65,21 @@ async def async_setup_entry(
     coordinator: ElegooDataUpdateCoordinator = config_entry.runtime_data.coordinator
     printer_type = coordinator.config_entry.runtime_data.api.printer.printer_type
 
+    entities: list[Camera] = []
     if printer_type == PrinterType.FDM:
-        LOGGER.debug(f"Adding {len(PRINTER_MJPEG_CAMERAS)} Camera entities")
-        for camera in PRINTER_MJPEG_CAMERAS:
-            async_add_entities(
-                [ElegooMjpegCamera(hass, coordinator, camera)], update_before_add=True
-            )
+        entities.extend(
+            ElegooMjpegCamera(hass, coordinator, camera)
+            for camera in PRINTER_MJPEG_CAMERAS
+        )
     elif printer_type == PrinterType.RESIN:
-        LOGGER.debug(f"Adding {len(PRINTER_FFMPEG_CAMERAS)} Camera entities")
-        for camera in PRINTER_FFMPEG_CAMERAS:
-            async_add_entities(
-                [ElegooStreamCamera(hass, coordinator, camera)],
-                update_before_add=True,
-            )
+        entities.extend(
+            ElegooStreamCamera(hass, coordinator, camera)
+            for camera in PRINTER_FFMPEG_CAMERAS
+        )
+
+    if entities:
+        LOGGER.debug(f"Adding {len(entities)} Camera entities")
+        async_add_entities(entities, update_before_add=True)
 
 
 class ElegooStreamCamera(ElegooPrinterEntity, Camera):
@@ -81,19 +96,20 @@ class ElegooStreamCamera(ElegooPrinterEntity, Camera):
         ElegooPrinterEntity.__init__(self, coordinator)
 
         self.entity_description = description
-        self._printer_client: ElegooPrinterClient = (
-            coordinator.config_entry.runtime_data.api.client
-        )
+        self._printer_client: ElegooPrinterClient = coordinator.printer_client
         self._attr_name = description.name
         self._attr_unique_id = coordinator.generate_unique_id(description.key)
         self._attr_entity_registry_enabled_default = coordinator.config_entry.data.get(
             CONF_CAMERA_ENABLED, False
         )
 
-        # For MJPEG stream
-        self._extra_ffmpeg_arguments = (
-            "-rtsp_transport udp -fflags nobuffer -err_detect ignore_err"
-        )
+        # For MJPEG stream and snapshots
+        self._ffmpeg_input_arguments = FFMPEG_INPUT_ARGUMENTS
+
+        # Cache the resolved stream URL to avoid a printer round-trip per request
+        self._stream_url: str | None = None
+        self._url_cache_ts: float | None = None
+        self._url_cache_ttl = URL_CACHE_TTL
 
     def _is_over_capacity(self) -> bool:
         """Check if the printer is over capacity."""
@@ -107,17 +123,49 @@ class ElegooStreamCamera(ElegooPrinterEntity, Camera):
         """Return supported features."""
         return self._attr_supported_features
 
+    def _ffmpeg_input(self, stream_url: str) -> str:
+        """
+        Build the ffmpeg input for a stream URL.
+
+        haffmpeg appends extra arguments after ``-i``, where input options such
+        as ``-rtsp_transport`` and ``-probesize`` no longer apply, so they are
+        placed in front of the URL instead.
+
+        Arguments:
+            stream_url: The printer's stream URL.
+
+        Returns:
+            The input options followed by ``-i`` and the URL.
+
+        """
+        return f"{self._ffmpeg_input_arguments} -i {shlex.quote(stream_url)}"
+
+    def _is_url_cache_fresh(self) -> bool:
+        """Check if the cached stream URL can be reused."""
+        return (
+            self._stream_url is not None
+            and self._url_cache_ts is not None
+            and self._printer_client.video_stream_ready
+            and time.monotonic() - self._url_cache_ts < self._url_cache_ttl
+        )
+
     async def _get_stream_url(self) -> str | None:
         """Get the stream URL, from cache if recent."""
         if (not self._printer_client.is_connected) or self._is_over_capacity():
+            self._stream_url = None
             return None
+        if self._is_url_cache_fresh():
+            return self._stream_url
         video = await self._printer_client.get_printer_video(enable=True)
         if video.status and video.status == ElegooVideoStatus.SUCCESS:
             LOGGER.debug(
                 f"stream_source: Video is OK, printer video url: {video.video_url}"
             )
+            self._stream_url = video.video_url
+            self._url_cache_ts = time.monotonic()
             return video.video_url
 
+        self._stream_url = None
         return None
 
     async def handle_async_mjpeg_stream(
@@ -133,9 +181,7 @@ class ElegooStreamCamera(ElegooPrinterEntity, Camera):
 
         ffmpeg_manager = self.hass.data[DOMAIN]
         mjpeg_stream = CameraMjpeg(ffmpeg_manager.binary)
-        await mjpeg_stream.open_camera(
-            stream_url, extra_cmd=self._extra_ffmpeg_arguments
-        )
+        await mjpeg_stream.open_camera(self._ffmpeg_input(stream_url))
 
         try:
             stream_reader = await mjpeg_stream.get_reader()
@@ -165,7 +211,7 @@ class ElegooStreamCamera(ElegooPrinterEntity, Camera):
         try:
             return await async_get_image(
                 self.hass,
-                input_source=stream_url,
+                input_source=self._ffmpeg_input(stream_url),
             )
         except Exception as e:  # noqa: BLE001
             LOGGER.error(
@@ -174,12 +220,12 @@ class ElegooStreamCamera(ElegooPrinterEntity, Camera):
             return None
 
 
-class ElegooMjpegCamera(ElegooPrinterEntity, MjpegCamera):
-    """Representation of an MjpegCamera."""
+class ElegooMjpegCamera(ElegooPrinterEntity, Camera):
+    """Representation of a camera that proxies an Elegoo printer's MJPEG stream."""
 
     def __init__(
         self,
-        hass: HomeAssistant,  # noqa: ARG002
+        hass: HomeAssistant,
         coordinator: ElegooDataUpdateCoordinator,
         description: ElegooPrinterSensorEntityDescription,
     ) -> None:
@@ -192,20 +238,29 @@ class ElegooMjpegCamera(ElegooPrinterEntity, MjpegCamera):
             description: The entity description.
 
         """
-        MjpegCamera.__init__(
-            self,
-            name=f"{description.name}",
-            mjpeg_url=f"http://{PROXY_HOST}:{WEBSOCKET_PORT}/{VIDEO_ENDPOINT}",
-            still_image_url=None,  # This camera does not have a separate still URL
-            unique_id=coordinator.generate_unique_id(description.key),
-        )
-
+        Camera.__init__(self)
         ElegooPrinterEntity.__init__(self, coordinator)
+
         self.entity_description = description
-        self._printer_client: ElegooPrinterClient = (
-            coordinator.config_entry.runtime_data.api.client
+        self._printer_client: ElegooPrinterClient = coordinator.printer_client
+        self._attr_name = description.name
+        self._attr_unique_id = coordinator.generate_unique_id(description.key)
+        self._mjpeg_url: str | None = (
+            f"http://{PROXY_HOST}:{WEBSOCKET_PORT}/{VIDEO_ENDPOINT}"
         )
 
+        # Cache the resolved stream URL to avoid a printer round-trip per request
+        self._url_cache_ts: float | None = None
+        self._url_cache_ttl = URL_CACHE_TTL
+
+        # All viewers share one upstream connection to the printer's stream
+        self._multiplexer = _MjpegMultiplexer(async_get_clientsession(hass))
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Close the shared upstream stream when the entity is removed."""
+        await super().async_will_remove_from_hass()
+        self._multiplexer.close()
+
     def _is_over_capacity(self) -> bool:
         """Check if the printer is over capacity."""
         attrs = self._printer_client.printer_data.attributes
@@ -213,6 +268,15 @@ class ElegooMjpegCamera(ElegooPrinterEntity, MjpegCamera):
         max_allowed = getattr(attrs, "max_video_stream_allowed", 0) or 0
         return num_connected >= max_allowed
 
+    def _is_url_cache_fresh(self) -> bool:
+        """Check if the cached MJPEG URL can be reused."""
+        return (
+            self._mjpeg_url is not None
+            and self._url_cache_ts is not None
+            and self._printer_client.video_stream_ready
+            and time.monotonic() - self._url_cache_ts < self._url_cache_ttl
+        )
+
     @staticmethod
     def _normalize_video_url(video_object: ElegooVideo) -> ElegooVideo:
         """
@@ -230,6 +294,9 @@ class ElegooMjpegCamera(ElegooPrinterEntity, MjpegCamera):
     async def _update_stream_url(self) -> None:
         """Update the MJPEG stream URL."""
         if (not self._printer_client.is_connected) or self._is_over_capacity():
+            self._url_cache_ts = None
+            return
+        if self._is_url_cache_fresh():
             return
         video = await self._printer_client.get_printer_video(enable=True)
         if video.status and video.status == ElegooVideoStatus.SUCCESS:
@@ -245,22 +312,309 @@ class ElegooMjpegCamera(ElegooPrinterEntity, MjpegCamera):
                     video.video_url,
                 )
                 self._mjpeg_url = self._normalize_video_url(video).video_url
+            self._url_cache_ts = time.monotonic()
         else:
             LOGGER.debug("stream_source: Failed to get video stream: %s", video.status)
             self._mjpeg_url = None
+            self._url_cache_ts = None
 
     async def async_camera_image(
-        self, width: int | None = None, height: int | None = None
+        self,
+        width: int | None = None,  # noqa: ARG002
+        height: int | None = None,  # noqa: ARG002
     ) -> bytes | None:
-        """Asynchronously gets the current MJPEG stream URL for the printer camera."""
+        """Return the latest frame, reading one from the stream if none is live."""
+        if frame := self._multiplexer.latest_frame:
+            return frame
         await self._update_stream_url()
         if (not self._mjpeg_url) or self._is_over_capacity():
             return None
-        return await super().async_camera_image(width=width, height=height)
+        return await self._multiplexer.async_get_frame(self._mjpeg_url)
 
     async def handle_async_mjpeg_stream(
         self, request: web.Request
     ) -> web.StreamResponse:
         """Generate an HTTP MJPEG stream from the camera."""
         await self._update_stream_url()
-        return await super().handle_async_mjpeg_stream(request)
+        if not self._mjpeg_url:
+            return web.Response(
+                status=HTTPStatus.SERVICE_UNAVAILABLE,
+                reason="Stream URL not available",
+            )
+        return await self._multiplexer.async_stream(request, self._mjpeg_url)
+
+
+class _MjpegMultiplexer:
+    """
+    Share one upstream MJPEG connection between every viewer of a camera.
+
+    A single reader task splits the upstream stream into JPEG frames and fans
+    them out to a small queue per viewer, dropping the oldest frame when a
+    viewer falls behind. The upstream is closed once the last viewer leaves.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession) -> None:
+        """Initialize the multiplexer with the session used for the upstream."""
+        self._session = session
+        self._url: str | None = None
+        self._reader: asyncio.Task[None] | None = None
+        self._viewers: set[asyncio.Queue[bytes]] = set()
+        self._latest_frame: bytes | None = None
+
+    @property
+    def latest_frame(self) -> bytes | None:
+        """Return the most recent frame while the upstream is being read."""
+        if self._reader is None or self._reader.done():
+            return None
+        return self._latest_frame
+
+    def subscribe(self, url: str) -> asyncio.Queue[bytes]:
+        """
+        Register a viewer and make sure the upstream reader is running.
+
+        Arguments:
+            url: The MJPEG URL the viewer wants frames from.
+
+        Returns:
+            The queue the viewer's frames are delivered on. An empty frame
+            signals that the upstream stream has ended.
+
+        """
+        if url != self._url:
+            self._stop_reader()
+            self._url = url
+        queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=MJPEG_VIEWER_QUEUE_SIZE)
+        self._viewers.add(queue)
+        if self._reader is None or self._reader.done():
+            self._latest_frame = None
+            self._reader = asyncio.create_task(self._read_upstream(url))
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[bytes]) -> None:
+        """Remove a viewer, closing the upstream if it was the last one."""
+        self._viewers.discard(queue)
+        if not self._viewers:
+            self._stop_reader()
+
+    def close(self) -> None:
+        """Drop every viewer and close the upstream."""
+        self._viewers.clear()
+        self._stop_reader()
+
+    async def async_get_frame(self, url: str) -> bytes | None:
+        """
+        Return the next frame from the shared stream.
+
+        Arguments:
+            url: The MJPEG URL to read the frame from.
+
+        Returns:
+            The JPEG bytes, or None if no frame arrived in time.
+
+        """
+        queue = self.subscribe(url)
+        try:
+            async with asyncio.timeout(MJPEG_FRAME_TIMEOUT):
+                frame = await queue.get()
+        except TimeoutError:
+            LOGGER.debug("Timed out waiting for a frame from %s", url)
+            return None
+        finally:
+            self.unsubscribe(queue)
+        return frame or None
+
+    async def async_stream(self, request: web.Request, url: str) -> web.StreamResponse:
+        """
+        Serve the shared stream to a single viewer as multipart MJPEG.
+
+        Arguments:
+            request: The viewer's HTTP request.
+            url: The MJPEG URL to stream from.
+
+        Returns:
+            The streamed response.
+
+        """
+        response = web.StreamResponse(
+            headers={
+                hdrs.CONTENT_TYPE: (
+                    f"multipart/x-mixed-replace;boundary={MJPEG_BOUNDARY}"
+                )
+            }
+        )
+        queue = self.subscribe(url)
+        try:
+            await response.prepare(request)
+            while True:
+                async with asyncio.timeout(MJPEG_FRAME_TIMEOUT):
+                    frame = await queue.get()
+                if not frame:
+                    break
+                await response.write(
+                    f"--{MJPEG_BOUNDARY}\r\n"
+                    "Content-Type: image/jpeg\r\n"
+                    f"Content-Length: {len(frame)}\r\n\r\n".encode()
+                )
+                await response.write(frame)
+                await response.write(b"\r\n")
+        except (TimeoutError, ConnectionResetError) as e:
+            LOGGER.debug("MJPEG viewer stream stopped: %s", e)
+        finally:
+            self.unsubscribe(queue)
+        return response
+
+    def _stop_reader(self) -> None:
+        """Cancel the upstream reader task if one is running."""
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+        self._latest_frame = None
+
+    async def _read_upstream(self, url: str) -> None:
+        """Read the upstream stream and publish each complete JPEG frame."""
+        try:
+            async with self._session.get(
+                url,
+                timeout=aiohttp.ClientTimeout(
+                    total=None, sock_connect=10, sock_read=MJPEG_FRAME_TIMEOUT
+                ),
+            ) as response:
+                response.raise_for_status()
+                boundary = _multipart_boundary(
+                    response.headers.get(hdrs.CONTENT_TYPE, "")
+                )
+                if boundary is None:
+                    LOGGER.debug("MJPEG upstream %s declared no boundary", url)
+                else:
+                    parser = _MjpegPartParser(boundary)
+                    async for chunk in response.content.iter_any():
+                        for frame in parser.feed(chunk):
+                            self._publish(frame)
+        except (TimeoutError, aiohttp.ClientError) as e:
+            LOGGER.debug("MJPEG upstream %s stopped: %s", url, e)
+        self._latest_frame = None
+        # Wake every viewer so it can end its response
+        self._publish(b"")
+
+    def _publish(self, frame: bytes) -> None:
+        """Hand a frame to every viewer, dropping its oldest frame if full."""
+        if frame:
+            self._latest_frame = frame
+        for queue in self._viewers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(frame)
+
+
+def _multipart_boundary(content_type: str) -> str | None:
+    """
+    Return the boundary parameter of a multipart Content-Type header.
+
+    Arguments:
+        content_type: The Content-Type header value.
+
+    Returns:
+        The boundary, or None if the header does not declare one.
+
+    """
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.strip().partition("=")
+        if key.strip().lower() == "boundary" and value:
+            return value.strip().strip('"')
+    return None
+
+
+class _MjpegPartParser:
+    """
+    Incrementally split a multipart/x-mixed-replace body into JPEG frames.
+
+    Each part is located by its boundary delimiter and sized by its
+    Content-Length header, so JPEGs that embed an EXIF thumbnail (and with it
+    a second end-of-image marker) are kept whole. Parts without a
+    Content-Length run until the next delimiter.
+    """
+
+    def __init__(self, boundary: str, max_size: int = MJPEG_MAX_FRAME_SIZE) -> None:
+        """
+        Initialize the parser for a stream's boundary.
+
+        Arguments:
+            boundary: The boundary parameter from the stream's Content-Type.
+                Cameras often declare it with the leading ``--`` already
+                included, so that prefix is not doubled.
+            max_size: Bytes to buffer for a single part before resyncing.
+
+        """
+        self._delimiter = b"--" + boundary.removeprefix("--").encode()
+        self._max_size = max_size
+        self._buffer = bytearray()
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """
+        Add received bytes and return every frame they complete.
+
+        Arguments:
+            chunk: The next bytes read from the upstream.
+
+        Returns:
+            The complete frames found, oldest first.
+
+        """
+        self._buffer += chunk
+        frames: list[bytes] = []
+        while (frame := self._next_frame()) is not None:
+            frames.append(frame)
+        if len(self._buffer) > self._max_size:
+            self._resync()
+        return frames
+
+    def _next_frame(self) -> bytes | None:
+        """Remove and return the first complete part, or None if none is whole."""
+        buffer = self._buffer
+        start = buffer.find(self._delimiter)
+        if start < 0:
+            # Keep enough bytes to match a delimiter split across chunks
+            del buffer[: -len(self._delimiter)]
+            return None
+        del buffer[:start]
+        headers_end = buffer.find(b"\r\n\r\n", len(self._delimiter))
+        if headers_end < 0:
+            return None
+        body_start = headers_end + 4
+        headers = bytes(buffer[len(self._delimiter) : headers_end])
+        length = _content_length(headers)
+        if length is not None and length <= self._max_size:
+            body_end = body_start + length
+            if len(buffer) < body_end:
+                return None
+            frame = bytes(buffer[body_start:body_end])
+        else:
+            # No usable length, so the part runs until the next delimiter
+            body_end = buffer.find(self._delimiter, body_start)
+            if body_end < 0:
+                return None
+            frame = bytes(buffer[body_start:body_end]).removesuffix(b"\r\n")
+        del buffer[:body_end]
+        return frame
+
+    def _resync(self) -> None:
+        """Drop a part that outgrew max_size and restart at the next delimiter."""
+        LOGGER.debug("MJPEG part exceeded %s bytes, resyncing", self._max_size)
+        next_start = self._buffer.find(self._delimiter, 1)
+        if next_start < 0:
+            self._buffer.clear()
+        else:
+            del self._buffer[:next_start]
+
+
+def _content_length(headers: bytes) -> int | None:
+    """Return the Content-Length declared in a part's header block, if valid."""
+    for line in headers.split(b"\r\n"):
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            try:
+                length = int(value.strip())
+            except ValueError:
+                return None
+            return length if length >= 0 else None
+    return None
@@ -130,9 +130,7 @@ async def _async_validate_input(  # noqa: PLR0912
             logger=LOGGER,
             session=async_get_clientsession(hass),
         )
-        printers = await hass.async_add_executor_job(
-            elegoo_printer.discover_printer, ip_address
-        )
+        printers = await elegoo_printer.discover_printer(ip_address)
         if printers:
             printer_object = printers[0]
         else:
@@ -197,9 +195,7 @@ class ElegooFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             logger=LOGGER,
             session=async_get_clientsession(self.hass),
         )  # IP doesn't matter for discovery
-        self.discovered_printers = await self.hass.async_add_executor_job(
-            elegoo_printer_client.discover_printer
-        )
+        self.discovered_printers = await elegoo_printer_client.discover_printer()
 
         if self.discovered_printers:
             return await self.async_step_discover_printers()
@@ -25,11 +25,23 @@ DEFAULT_BROADCAST_ADDRESS = "255.255.255.255"
 DEFAULT_FALLBACK_IP = "127.0.0.1"
 DISCOVERY_MESSAGE = "M99999"
 DISCOVERY_PORT = 3000
+LOCAL_IP_CACHE_TTL = 60.0  # seconds a resolved local IP is reused
 PROXY_HOST = "127.0.0.1"
 VIDEO_ENDPOINT = "video"
 VIDEO_PORT = 3031
 WEBSOCKET_PORT = 3030
 
+# Camera settings
+# Input options must precede -i; probing is skipped so playback starts quickly
+FFMPEG_INPUT_ARGUMENTS = (
+    "-rtsp_transport udp -probesize 32 -analyzeduration 0 "
+    "-fflags nobuffer -flags low_delay -err_detect ignore_err"
+)
+MJPEG_FRAME_TIMEOUT = 10.0  # seconds to wait for the next shared MJPEG frame
+MJPEG_MAX_FRAME_SIZE = 4 * 1024 * 1024  # bytes buffered per part before resyncing
+MJPEG_VIEWER_QUEUE_SIZE = 2  # frames buffered per viewer before dropping
+URL_CACHE_TTL = 30.0  # seconds a resolved stream URL is reused
+
 # Error messages
 MIGRATE_V4_ERROR = (
     "Migration v3->v4 failed: 'name' or 'id' field is missing from config."
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 import httpx
@@ -19,6 +20,7 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from .data import ElegooPrinterConfigEntry
+    from .websocket.client import ElegooPrinterClient
 
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
@@ -40,6 +42,11 @@ class ElegooDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=2),
         )
 
+    @cached_property
+    def printer_client(self) -> ElegooPrinterClient:
+        """Return the websocket client, resolved once from the runtime data."""
+        return self.config_entry.runtime_data.api.client
+
     async def _async_update_data(self) -> Any:
         """
         Asynchronously fetches and updates the latest attributes and status from the Elegoo printer.
@@ -60,9 +60,7 @@ class ElegooLight(ElegooPrinterEntity, LightEntity):
         """  # noqa: E501
         super().__init__(coordinator)
         self.entity_description: ElegooPrinterLightEntityDescription = description
-        self._elegoo_printer_client: ElegooPrinterClient = (
-            coordinator.config_entry.runtime_data.api.client
-        )
+        self._elegoo_printer_client: ElegooPrinterClient = coordinator.printer_client
         # Set a unique ID and a friendly name for the entity
         self._attr_unique_id = coordinator.generate_unique_id(
             self.entity_description.key
@@ -169,4 +169,18 @@ class PrinterAttributes:
             data: dict[
                 str, Any
             ] = {}  # Return an empty object or handle the error as needed
+        return cls.from_dict(data)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PrinterAttributes":
+        """
+        Create a PrinterAttributes object from an already decoded dictionary.
+
+        Arguments:
+            data (dict[str, Any]): A dictionary containing printer attribute data.
+
+        Returns:
+            PrinterAttributes: A new PrinterAttributes object.
+
+        """
         return cls(data)
@@ -236,4 +236,11 @@ class PrinterStatus:
             data = json.loads(json_string)
         except json.JSONDecodeError:
             data = {}  # Or handle the error as needed
+        return cls.from_dict(data, printer_type)
+
+    @classmethod
+    def from_dict(
+        cls, data: dict[str, Any], printer_type: PrinterType | None = None
+    ) -> "PrinterStatus":
+        """Create a PrinterStatus object from an already decoded dictionary."""
         return cls(data, printer_type)
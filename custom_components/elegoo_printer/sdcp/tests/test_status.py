@@ -0,0 +1,49 @@
+"""Tests for the status and attributes models in the Elegoo SDCP models."""
+
+import json
+
+from custom_components.elegoo_printer.sdcp.models.attributes import (
+    PrinterAttributes,
+)
+from custom_components.elegoo_printer.sdcp.models.enums import PrinterType
+from custom_components.elegoo_printer.sdcp.models.status import PrinterStatus
+
+HOTBED_TEMP = 60.12
+NOZZLE_TEMP = 210.46
+MODEL_FAN_SPEED = 100
+TIMESTAMP = 1700000000
+
+
+def test_printer_status_from_dict_matches_from_json() -> None:
+    """Test that from_dict builds the same status as the JSON round-trip."""
+    data = {
+        "Status": {
+            "CurrentStatus": [0],
+            "TempOfHotbed": 60.123,
+            "TempOfNozzle": 210.456,
+            "CurrentFanSpeed": {"ModelFan": MODEL_FAN_SPEED},
+        }
+    }
+
+    from_dict = PrinterStatus.from_dict(data, PrinterType.FDM)
+    from_json = PrinterStatus.from_json(json.dumps(data), PrinterType.FDM)
+
+    assert from_dict.temp_of_hotbed == from_json.temp_of_hotbed == HOTBED_TEMP
+    assert from_dict.temp_of_nozzle == from_json.temp_of_nozzle == NOZZLE_TEMP
+    assert from_dict.current_fan_speed.model_fan == MODEL_FAN_SPEED
+    assert from_dict.current_status == from_json.current_status
+
+
+def test_printer_attributes_from_dict() -> None:
+    """Test that from_dict reads attributes from an already decoded payload."""
+    data = {
+        "Attributes": {"Name": "My Printer", "MainboardID": "ABCDEF"},
+        "MainboardID": "ABCDEF",
+        "TimeStamp": TIMESTAMP,
+    }
+
+    attributes = PrinterAttributes.from_dict(data)
+
+    assert attributes.name == "My Printer"
+    assert attributes.mainboard_id == "ABCDEF"
+    assert attributes.timestamp == TIMESTAMP
@@ -0,0 +1,72 @@
+"""Tests for splitting the shared MJPEG camera stream into frames."""
+
+from custom_components.elegoo_printer.camera import (
+    _MjpegPartParser,
+    _multipart_boundary,
+)
+
+# A JPEG whose embedded EXIF thumbnail carries its own end-of-image marker
+EXIF_JPEG = b"\xff\xd8\xff\xe1exif\xff\xd8thumb\xff\xd9more-image-data\xff\xd9"
+PLAIN_JPEG = b"\xff\xd8plain\xff\xd9"
+MAX_SIZE = 64
+
+
+def _part(image: bytes, *, length: bool = True) -> bytes:
+    """Build one multipart part the way the printer's camera server does."""
+    headers = b"--jpgboundary\r\nContent-type: image/jpeg\r\n"
+    if length:
+        headers += b"Content-length: " + str(len(image)).encode() + b"\r\n"
+    return headers + b"\r\n" + image + b"\r\n"
+
+
+def test_multipart_boundary() -> None:
+    """Test that the boundary is read from the Content-Type header."""
+    assert (
+        _multipart_boundary("multipart/x-mixed-replace; boundary=--jpgboundary")
+        == "--jpgboundary"
+    )
+    assert _multipart_boundary('multipart/x-mixed-replace;Boundary="frame"') == "frame"
+    assert _multipart_boundary("image/jpeg") is None
+
+
+def test_frames_with_exif_thumbnail_are_kept_whole() -> None:
+    """Test that a second end-of-image marker does not truncate a frame."""
+    parser = _MjpegPartParser("--jpgboundary")
+
+    frames = parser.feed(_part(EXIF_JPEG) + _part(PLAIN_JPEG))
+
+    assert frames == [EXIF_JPEG, PLAIN_JPEG]
+
+
+def test_frames_split_across_chunks() -> None:
+    """Test that frames are reassembled when delivered one byte at a time."""
+    parser = _MjpegPartParser("jpgboundary")
+    stream = _part(EXIF_JPEG) + _part(PLAIN_JPEG)
+
+    frames = [frame for byte in stream for frame in parser.feed(bytes([byte]))]
+
+    assert frames == [EXIF_JPEG, PLAIN_JPEG]
+
+
+def test_parts_without_content_length() -> None:
+    """Test that a part without a length runs until the next delimiter."""
+    parser = _MjpegPartParser("--jpgboundary")
+
+    frames = parser.feed(
+        _part(EXIF_JPEG, length=False) + _part(PLAIN_JPEG, length=False)
+    )
+
+    assert frames == [EXIF_JPEG]
+    assert parser.feed(b"--jpgboundary\r\n") == [PLAIN_JPEG]
+
+
+def test_oversized_part_is_dropped_and_parser_resyncs() -> None:
+    """Test that a part larger than the cap is discarded without stalling."""
+    parser = _MjpegPartParser("--jpgboundary", max_size=MAX_SIZE)
+
+    assert parser.feed(_part(b"\xff\xd8" + b"x" * MAX_SIZE, length=False)) == []
+    assert len(parser._buffer) <= MAX_SIZE  # noqa: SLF001
+
+    frames = parser.feed(_part(PLAIN_JPEG) + _part(PLAIN_JPEG))
+
+    assert frames == [PLAIN_JPEG, PLAIN_JPEG]
@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 import asyncio
-import json
-import logging
-import secrets
+import os
+import random
 import socket
+import sys
 import time
+from collections import deque
 from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
+import orjson
 from aiohttp import ClientWebSocketResponse
 from aiohttp.client import ClientWSTimeout
 
@@ -20,6 +22,7 @@ from custom_components.elegoo_printer.const import (
     DEFAULT_FALLBACK_IP,
     DISCOVERY_MESSAGE,
     DISCOVERY_PORT,
+    LOCAL_IP_CACHE_TTL,
     WEBSOCKET_PORT,
 )
 from custom_components.elegoo_printer.sdcp.const import (
@@ -42,6 +45,7 @@ from custom_components.elegoo_printer.sdcp.exceptions import (
     ElegooPrinterTimeoutError,
 )
 from custom_components.elegoo_printer.sdcp.models.attributes import PrinterAttributes
+from custom_components.elegoo_printer.sdcp.models.enums import ElegooVideoStatus
 from custom_components.elegoo_printer.sdcp.models.print_history_detail import (
     PrintHistoryDetail,
 )
@@ -58,11 +62,16 @@ from custom_components.elegoo_printer.sdcp.models.video import ElegooVideo
 if TYPE_CHECKING:
     from custom_components.elegoo_printer.sdcp.models.enums import ElegooFan
 
-logging.getLogger("websocket").setLevel(logging.CRITICAL)
-
-DISCOVERY_TIMEOUT = 5
+DISCOVERY_TIMEOUT = 2
+DISCOVERY_SETTLE_TIME = 0.5  # stop once no new reply arrives for this long
+DISCOVERY_RCVBUF = 262144  # room for replies from many printers at once
+WEBSOCKET_CONNECT_TIMEOUT = 5
 DEFAULT_PORT = 54780
 
+# RequestIDs only correlate replies with waiters, so a seeded PRNG is enough
+# and avoids a getrandom() syscall per command.
+_rng = random.Random(os.urandom(16))  # noqa: S311
+
 
 class ElegooPrinterClient:
     """
@@ -96,14 +105,25 @@ class ElegooPrinterClient:
         self.printer_websocket: ClientWebSocketResponse | None = None
         self.config = config
         self.printer: Printer = Printer.from_dict(dict(config))
+        self._cmd_template: dict[str, Any] = self._build_cmd_template()
         self.printer_data = PrinterData()
         self.logger = logger
         self._is_connected: bool = False
         self._listener_task: asyncio.Task | None = None
         self._session: aiohttp.ClientSession = session
         self._background_tasks: set[asyncio.Task] = set()
-        self._response_events: dict[str, asyncio.Event] = {}
-        self._response_lock = asyncio.Lock()
+        self._pending: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        # Decoded messages wait here for the drain task. A None entry marks
+        # where the newest status (_rx_status) is applied, so a burst of
+        # status updates is only ever built once.
+        self._rx_queue: deque[dict[str, Any] | None] = deque()
+        self._rx_status: dict[str, Any] | None = None
+        self._rx_ready = asyncio.Event()
+        # Cleared whenever the connection drops so cameras re-request the stream
+        self.video_stream_ready: bool = False
+        self._video_inflight: dict[bool, asyncio.Task[ElegooVideo]] = {}
+        self._local_ip: str | None = None
+        self._local_ip_ts: float = 0.0
 
     @property
     def is_connected(self) -> bool:
@@ -122,12 +142,9 @@ class ElegooPrinterClient:
             self._listener_task = None
         if self.printer_websocket and not self.printer_websocket.closed:
             await self.printer_websocket.close()
-        # NEW: unblock any waiters
-        async with self._response_lock:
-            for ev in self._response_events.values():
-                ev.set()
-            self._response_events.clear()
+        self._fail_pending("Printer disconnected")
         self._is_connected = False
+        self.video_stream_ready = False
 
     async def get_printer_status(self) -> PrinterData:
         """
@@ -159,6 +176,9 @@ class ElegooPrinterClient:
         """
         Enable the printer's video stream and retrieve the current video stream information.
 
+        Concurrent callers asking for the same state share a single in-flight
+        request instead of each sending their own command to the printer.
+
         Arguments:
             enable: If True, enables the video stream; if False, disables it.
 
@@ -166,6 +186,28 @@ class ElegooPrinterClient:
             The current video stream information from the printer.
 
         """  # noqa: E501
+        inflight = self._video_inflight.get(enable)
+        if inflight is None or inflight.done():
+            inflight = asyncio.create_task(self._fetch_printer_video(enable=enable))
+            self._video_inflight[enable] = inflight
+            inflight.add_done_callback(
+                lambda task: self._video_fetch_done(task, enable=enable)
+            )
+        return await asyncio.shield(inflight)
+
+    def _video_fetch_done(
+        self, task: asyncio.Task[ElegooVideo], *, enable: bool
+    ) -> None:
+        """Forget a finished video request and consume its outcome."""
+        if self._video_inflight.get(enable) is task:
+            del self._video_inflight[enable]
+        # Every caller may have been cancelled, so retrieve the exception here
+        if not task.cancelled() and (e := task.exception()) is not None:
+            msg = f"Video stream request failed: {e}"
+            self.logger.debug(msg)
+
+    async def _fetch_printer_video(self, *, enable: bool) -> ElegooVideo:
+        """Send the video stream command and return the resulting video info."""
         await self.set_printer_video_stream(enable=enable)
         msg = f"Sending printer video: {self.printer_data.video.to_dict()}"
         self.logger.debug(msg)
@@ -359,9 +401,24 @@ class ElegooPrinterClient:
         data = {"TempTargetHotbed": clamped_temperature}
         await self._send_printer_cmd(CMD_CONTROL_DEVICE, data)
 
+    def _build_cmd_template(self) -> dict[str, Any]:
+        """Build the command envelope fields that are fixed for this printer."""
+        return {
+            "Id": self.printer.connection,
+            "Data": {
+                "Cmd": 0,
+                "Data": {},
+                "RequestID": "",
+                "MainboardID": self.printer.id,
+                "TimeStamp": 0,
+                "From": 0,
+            },
+            "Topic": f"sdcp/request/{self.printer.id}",
+        }
+
     async def _send_printer_cmd(
         self, cmd: int, data: dict[str, Any] | None = None
-    ) -> None:
+    ) -> dict[str, Any]:
         """
         Send a JSON command to the printer via the WebSocket connection.
 
@@ -369,6 +426,9 @@ class ElegooPrinterClient:
             cmd: The command to send.
             data: The data to send with the command.
 
+        Returns:
+            The printer's response message for this command.
+
         Raises:
             ElegooPrinterNotConnectedError: If the printer is not connected.
             ElegooPrinterConnectionError: If a WebSocket error or timeout occurs.
@@ -378,33 +438,25 @@ class ElegooPrinterClient:
         if not self.is_connected:
             msg = "Printer not connected, cannot send command."
             raise ElegooPrinterNotConnectedError(msg)
-        ts = int(time.time())
-        data = data or {}
-        request_id = secrets.token_hex(8)
-        payload = {
-            "Id": self.printer.connection,
-            "Data": {
-                "Cmd": cmd,
-                "Data": data,
-                "RequestID": request_id,
-                "MainboardID": self.printer.id,
-                "TimeStamp": ts,
-                "From": 0,
-            },
-            "Topic": f"sdcp/request/{self.printer.id}",
-        }
-        if DEBUG:
-            msg = f"printer << \n{json.dumps(payload, indent=4)}"
-            self.logger.debug(msg)
-
-        event = asyncio.Event()
-        async with self._response_lock:
-            self._response_events[request_id] = event
+        request_id = _rng.randbytes(8).hex()
+        # Only the per-command fields change; serialize before the next await
+        # so the shared template is never observed half-updated.
+        payload = self._cmd_template
+        body = payload["Data"]
+        body["Cmd"] = cmd
+        body["Data"] = data or {}
+        body["RequestID"] = request_id
+        body["TimeStamp"] = time.time_ns() // 1_000_000_000
+        frame = orjson.dumps(payload)
+        self.logger.debug(_PrettyJson("printer <<", frame))
 
         if self.printer_websocket:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[request_id] = future
             try:
-                await self.printer_websocket.send_str(json.dumps(payload))
-                await asyncio.wait_for(event.wait(), timeout=10)
+                # orjson already produced UTF-8, so skip send_str's re-encode
+                await self.printer_websocket.send_frame(frame, aiohttp.WSMsgType.TEXT)
+                return await asyncio.wait_for(future, timeout=10)
             except TimeoutError as e:
                 # Command-level timeout: keep the connection alive
                 self.logger.warning(
@@ -418,21 +470,22 @@ class ElegooPrinterClient:
                 self.logger.info("WebSocket connection closed error")
                 raise ElegooPrinterConnectionError from e
             finally:
-                async with self._response_lock:
-                    self._response_events.pop(request_id, None)
+                self._pending.pop(request_id, None)
         else:
             msg = "Not connected"
             raise ElegooPrinterNotConnectedError(msg)
 
-    def discover_printer(
+    async def discover_printer(
         self, broadcast_address: str = DEFAULT_BROADCAST_ADDRESS
     ) -> list[Printer]:
         """
         Broadcasts a UDP discovery message to locate Elegoo printers or proxies.
 
-        Sends a discovery request and collects responses within a timeout period,
-        returning a list of discovered printers. If no printers are found or a
-        socket error occurs, returns an empty list.
+        Sends a discovery request without blocking the event loop and collects
+        every response that arrives within the discovery window, returning a
+        list of discovered printers. The window closes early once replies stop
+        arriving. If no printers are found or a socket error occurs, returns an
+        empty list.
 
         Arguments:
             broadcast_address: The network address to send the discovery message to.
@@ -443,28 +496,54 @@ class ElegooPrinterClient:
         """
         discovered_printers: list[Printer] = []
         self.logger.info("Broadcasting for printer/proxy discovery...")
-        msg = DISCOVERY_MESSAGE.encode()
-        with socket.socket(
-            socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP
-        ) as sock:
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            sock.settimeout(DISCOVERY_TIMEOUT)
-            try:
-                sock.sendto(msg, (broadcast_address, DISCOVERY_PORT))
-                while True:
-                    try:
-                        data, addr = sock.recvfrom(8192)
-                        msg = f"Discovery response received from {addr}"
-                        self.logger.info(msg)
-                        printer = self._save_discovered_printer(data)
-                        if printer:
-                            discovered_printers.append(printer)
-                    except TimeoutError:
-                        break  # Timeout, no more responses
-            except OSError as e:
-                msg = f"Socket error during discovery: {e}"
-                self.logger.exception(msg)
-                return []
+        loop = asyncio.get_running_loop()
+        responses: asyncio.Queue[tuple[bytes, tuple[str, int]]] = asyncio.Queue()
+        try:
+            # Resolve up front: sendto() would look up a hostname synchronously
+            address_info = await loop.getaddrinfo(
+                broadcast_address,
+                DISCOVERY_PORT,
+                family=socket.AF_INET,
+                type=socket.SOCK_DGRAM,
+            )
+        except socket.gaierror as e:
+            msg = f"Could not resolve discovery address {broadcast_address}: {e}"
+            self.logger.warning(msg)
+            return []
+        target = address_info[0][4]
+        try:
+            transport, _ = await loop.create_datagram_endpoint(
+                lambda: _DiscoveryProtocol(responses, self.logger),
+                family=socket.AF_INET,
+                allow_broadcast=True,
+            )
+        except OSError as e:
+            msg = f"Socket error during discovery: {e}"
+            self.logger.exception(msg)
+            return []
+
+        try:
+            self._enlarge_receive_buffer(transport.get_extra_info("socket"))
+            transport.sendto(DISCOVERY_MESSAGE.encode(), target)
+            hard_deadline = loop.time() + DISCOVERY_TIMEOUT
+            deadline = hard_deadline
+            seen: set[tuple[str, int]] = set()
+            while (remaining := deadline - loop.time()) > 0:
+                try:
+                    data, addr = await asyncio.wait_for(responses.get(), remaining)
+                except TimeoutError:
+                    break  # Timeout, no more responses
+                deadline = min(hard_deadline, loop.time() + DISCOVERY_SETTLE_TIME)
+                if addr in seen:
+                    continue
+                seen.add(addr)
+                msg = f"Discovery response received from {addr}"
+                self.logger.info(msg)
+                printer = self._save_discovered_printer(data)
+                if printer:
+                    discovered_printers.append(printer)
+        finally:
+            transport.close()
 
         if not discovered_printers:
             self.logger.warning("No printers found during discovery.")
@@ -482,21 +561,57 @@ class ElegooPrinterClient:
             )
         ]
 
+    def _enlarge_receive_buffer(self, sock: socket.socket) -> None:
+        """
+        Raise SO_RCVBUF so a burst of discovery replies is not dropped.
+
+        The kernel silently caps the size at net.core.rmem_max, so the value
+        is read back and a capped buffer is logged at debug level. Even a capped
+        buffer holds far more replies than a network has printers, and most
+        Home Assistant installs cannot change the sysctl. Linux reserves
+        bookkeeping space by doubling the request and reports the doubled size.
+
+        Arguments:
+            sock: The discovery socket.
+
+        """
+        expected = DISCOVERY_RCVBUF * 2 if sys.platform == "linux" else DISCOVERY_RCVBUF
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, DISCOVERY_RCVBUF)
+            actual = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+        except OSError as e:
+            msg = f"Could not enlarge discovery receive buffer: {e}"
+            self.logger.debug(msg)
+            return
+        if actual < expected:
+            msg = (
+                f"Discovery receive buffer capped at {actual} bytes (expected "
+                f"{expected}) by net.core.rmem_max"
+            )
+            self.logger.debug(msg)
+
     def get_local_ip(self) -> str:
         """
         Determine the local IP address used for outbound communication to the printer.
 
+        The result is cached for LOCAL_IP_CACHE_TTL seconds.
+
         Returns:
             The local IP address, or "127.0.0.1" if detection fails.
 
         """
+        now = time.monotonic()
+        if self._local_ip and now - self._local_ip_ts < LOCAL_IP_CACHE_TTL:
+            return self._local_ip
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
                 # Doesn't have to be reachable
                 s.connect((self.ip_address or DEFAULT_FALLBACK_IP, 1))
-                return s.getsockname()[0]
+                self._local_ip = s.getsockname()[0]
         except (socket.gaierror, OSError):
             return "127.0.0.1"
+        self._local_ip_ts = now
+        return self._local_ip
 
     def _save_discovered_printer(self, data: bytes) -> Printer | None:
         """
@@ -583,15 +698,19 @@ class ElegooPrinterClient:
 
         self.printer = printer
         self.printer.proxy_enabled = proxy_enabled
+        self._cmd_template = self._build_cmd_template()
         msg = f"Connecting to printer: {self.printer.name} at {self.printer.ip_address} proxy_enabled: {proxy_enabled}"  # noqa: E501
         self.logger.info(msg)
 
         url = f"ws://{self.printer.ip_address}:{WEBSOCKET_PORT}/websocket"
         try:
             timeout = ClientWSTimeout()
-            self.printer_websocket = await self._session.ws_connect(
-                url, timeout=timeout, heartbeat=20
-            )
+            # Bound the handshake so an unresponsive printer fails fast instead
+            # of holding setup for the session's default connect timeout.
+            async with asyncio.timeout(WEBSOCKET_CONNECT_TIMEOUT):
+                self.printer_websocket = await self._session.ws_connect(
+                    url, timeout=timeout, heartbeat=20
+                )
             self._is_connected = True
             self._listener_task = asyncio.create_task(self._ws_listener())
             msg = f"Client successfully connected to: {self.printer.name}, via proxy: {proxy_enabled}"  # noqa: E501
@@ -613,10 +732,13 @@ class ElegooPrinterClient:
         if not self.printer_websocket:
             return
 
+        self._rx_queue.clear()
+        self._rx_status = None
+        drain_task = asyncio.create_task(self._rx_drain())
         try:
             async for msg in self.printer_websocket:
                 if msg.type == aiohttp.WSMsgType.TEXT:
-                    self._parse_response(msg.data)
+                    self._enqueue_message(msg.data)
                 elif msg.type == aiohttp.WSMsgType.ERROR:
                     error_str = f"WebSocket connection error: {self.printer_websocket.exception()}"  # noqa: E501
                     self.logger.info(error_str)
@@ -628,48 +750,113 @@ class ElegooPrinterClient:
             self.logger.exception(msg)
             raise ElegooPrinterConnectionError from e
         finally:
-            self._is_connected = False
-            self.logger.info("WebSocket listener stopped.")
+            drain_task.cancel()
+            try:
+                # Let responses that already arrived resolve their waiters
+                self._process_rx_queue()
+            finally:
+                self._is_connected = False
+                self.video_stream_ready = False
+                self._fail_pending("WebSocket listener stopped")
+                self.logger.info("WebSocket listener stopped.")
+
+    def _enqueue_message(self, response: str) -> None:
+        """
+        Decode a frame and queue it for the drain task.
+
+        Status messages are latest-wins: a newer one replaces a status still
+        waiting in the queue instead of taking another slot. Every other
+        message is kept and handled in arrival order.
+
+        Arguments:
+            response: The raw JSON frame received from the printer.
+
+        """
+        if (data := self._parse_response(response)) is None:
+            return
+        if _topic_kind(data) == "status":
+            if self._rx_status is None:
+                self._rx_queue.append(None)
+            self._rx_status = data
+        else:
+            self._rx_queue.append(data)
+        self._rx_ready.set()
+
+    async def _rx_drain(self) -> None:
+        """Process queued messages until cancelled."""
+        while True:
+            await self._rx_ready.wait()
+            self._rx_ready.clear()
+            self._process_rx_queue()
 
-    def _parse_response(self, response: str) -> None:
+    def _process_rx_queue(self) -> None:
         """
-        Parse and route an incoming JSON response message from the printer.
+        Route every queued message in order, isolating failures per message.
+
+        A message whose handler raises is logged and skipped, so it cannot
+        take the rest of the queue, and the responses in it, down with it.
+        """
+        while self._rx_queue:
+            data = self._rx_queue.popleft()
+            if data is None:
+                data, self._rx_status = self._rx_status, None
+            try:
+                self._route_message(data)
+            except Exception:
+                self.logger.exception("Error handling printer message")
 
-        Attempts to decode the response as JSON and dispatches it to the appropriate
-        handler based on the message topic. Logs unknown topics, missing topics, and
-        JSON decoding errors.
+    def _parse_response(self, response: str) -> dict[str, Any] | None:
+        """
+        Decode an incoming JSON message from the printer.
 
         Arguments:
             response: The JSON response message to parse.
 
+        Returns:
+            The decoded message, or None if it is not a valid JSON object.
+
         """
         try:
-            data = json.loads(response)
-            topic = data.get("Topic")
-            if topic:
-                match topic.split("/")[1]:
-                    case "response":
-                        self._response_handler(data)
-                    case "status":
-                        self._status_handler(data)
-                    case "attributes":
-                        self._attributes_handler(data)
-                    case "notice":
-                        msg = f"notice >> \n{json.dumps(data, indent=5)}"
-                        self.logger.debug(msg)
-                    case "error":
-                        msg = f"error >> \n{json.dumps(data, indent=5)}"
-                        self.logger.debug(msg)
-                    case _:
-                        self.logger.debug("--- UNKNOWN MESSAGE ---")
-                        self.logger.debug(data)
-                        self.logger.debug("--- UNKNOWN MESSAGE ---")
-            else:
-                self.logger.warning("Received message without 'Topic'")
-                msg = f"Message content: {response}"
-                self.logger.debug(msg)
-        except json.JSONDecodeError:
+            data = orjson.loads(response)
+        except orjson.JSONDecodeError:
             self.logger.exception("Invalid JSON received")
+            return None
+        if not isinstance(data, dict):
+            msg = f"Ignoring non-object message: {response}"
+            self.logger.warning(msg)
+            return None
+        return data
+
+    def _route_message(self, data: dict[str, Any]) -> None:
+        """
+        Route a decoded message from the printer to the appropriate handler.
+
+        Dispatches on the message topic and logs unknown and missing topics.
+
+        Arguments:
+            data: The decoded message.
+
+        """
+        if kind := _topic_kind(data):
+            match kind:
+                case "response":
+                    self._response_handler(data)
+                case "status":
+                    self._status_handler(data)
+                case "attributes":
+                    self._attributes_handler(data)
+                case "notice":
+                    self.logger.debug(_PrettyJson("notice >>", data))
+                case "error":
+                    self.logger.debug(_PrettyJson("error >>", data))
+                case _:
+                    self.logger.debug("--- UNKNOWN MESSAGE ---")
+                    self.logger.debug(data)
+                    self.logger.debug("--- UNKNOWN MESSAGE ---")
+        else:
+            self.logger.warning("Received message without 'Topic'")
+            msg = f"Message content: {data}"
+            self.logger.debug(msg)
 
     def _response_handler(self, data: dict[str, Any]) -> None:
         """
@@ -682,27 +869,31 @@ class ElegooPrinterClient:
             data: The response data.
 
         """  # noqa: E501
-        if DEBUG:
-            msg = f"response >> \n{json.dumps(data, indent=5)}"
-            self.logger.debug(msg)
+        self.logger.debug(_PrettyJson("response >>", data))
+        inner_data = data.get("Data")
+        if not inner_data:
+            return
+        request_id = inner_data.get("RequestID")
         try:
-            inner_data = data.get("Data")
-            if inner_data:
-                request_id = inner_data.get("RequestID")
-                if request_id:
-                    task = asyncio.create_task(self._set_response_event(request_id))
-                    self._background_tasks.add(task)
-                    task.add_done_callback(self._background_tasks.discard)
-                data_data = inner_data.get("Data", {})
-                cmd: int = inner_data.get("Cmd", 0)
-                if cmd == CMD_RETRIEVE_HISTORICAL_TASKS:
-                    self._print_history_handler(data_data)
-                elif cmd == CMD_RETRIEVE_TASK_DETAILS:
-                    self._print_history_detail_handler(data_data)
-                elif cmd == CMD_SET_VIDEO_STREAM:
-                    self._print_video_handler(data_data)
-        except json.JSONDecodeError:
+            data_data = inner_data.get("Data", {})
+            cmd: int = inner_data.get("Cmd", 0)
+            if cmd == CMD_RETRIEVE_HISTORICAL_TASKS:
+                self._print_history_handler(data_data)
+            elif cmd == CMD_RETRIEVE_TASK_DETAILS:
+                self._print_history_detail_handler(data_data)
+            elif cmd == CMD_SET_VIDEO_STREAM:
+                self._print_video_handler(data_data)
+        except orjson.JSONDecodeError as e:
             self.logger.exception("Invalid JSON")
+            self._reject_pending(request_id, e)
+        except Exception as e:
+            # Fail the sender now instead of leaving it to time out
+            self._reject_pending(request_id, e)
+            raise
+        else:
+            # Resolve the waiter only once printer_data reflects this response
+            if request_id:
+                self._resolve_pending(request_id, data)
 
     def _status_handler(self, data: dict[str, Any]) -> None:
         """
@@ -712,12 +903,8 @@ class ElegooPrinterClient:
             data: Dictionary containing the printer status information in JSON-compatible format.
 
         """  # noqa: E501
-        if DEBUG:
-            msg = f"status >> \n{json.dumps(data, indent=5)}"
-            self.logger.info(msg)
-        printer_status = PrinterStatus.from_json(
-            json.dumps(data), self.printer.printer_type
-        )
+        self.logger.debug(_PrettyJson("status >>", data))
+        printer_status = PrinterStatus.from_dict(data, self.printer.printer_type)
         self.printer_data.status = printer_status
 
     def _attributes_handler(self, data: dict[str, Any]) -> None:
@@ -728,10 +915,8 @@ class ElegooPrinterClient:
             data: Dictionary containing printer attribute information.
 
         """
-        if DEBUG:
-            msg = f"attributes >> \n{json.dumps(data, indent=5)}"
-            self.logger.info(msg)
-        printer_attributes = PrinterAttributes.from_json(json.dumps(data))
+        self.logger.debug(_PrettyJson("attributes >>", data))
+        printer_attributes = PrinterAttributes.from_dict(data)
         self.printer_data.attributes = printer_attributes
 
     def _print_history_handler(self, data_data: dict[str, Any]) -> None:
@@ -769,11 +954,88 @@ class ElegooPrinterClient:
 
         """
         self.printer_data.video = ElegooVideo(data_data)
+        self.video_stream_ready = (
+            self.printer_data.video.status == ElegooVideoStatus.SUCCESS
+        )
+
+    def _resolve_pending(self, request_id: str, data: dict[str, Any]) -> None:
+        """
+        Resolve the future waiting on a given request ID with its response.
+
+        Runs inline on the event loop from the listener, so no lock or extra
+        task is needed to touch the pending map.
+        """
+        future = self._pending.pop(request_id, None)
+        if future is None:
+            msg = f"No waiter found for RequestID={request_id}"
+            self.logger.debug(msg)
+        elif not future.done():
+            future.set_result(data)
+
+    def _reject_pending(self, request_id: str | None, error: Exception) -> None:
+        """Fail the future waiting on a request whose response could not be handled."""
+        future = self._pending.pop(request_id, None) if request_id else None
+        if future is not None and not future.done():
+            future.set_exception(error)
+
+    def _fail_pending(self, reason: str) -> None:
+        """Fail every outstanding command so its sender stops waiting."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(ElegooPrinterNotConnectedError(reason))
+
+
+def _topic_kind(data: dict[str, Any]) -> str | None:
+    """Return the message kind from a topic like ``sdcp/status/<id>``."""
+    topic = data.get("Topic")
+    if not isinstance(topic, str):
+        return None
+    parts = topic.split("/")
+    return parts[1] if len(parts) > 1 else None
+
+
+class _PrettyJson:
+    """
+    Render a labelled message as indented JSON only when a log record is emitted.
+
+    Passed as the log message itself, so both the standard library logger and
+    loguru (used by debug.py) call ``str()`` on it only after the level check,
+    and disabled debug logging costs nothing per message.
+    """
+
+    __slots__ = ("_data", "_label")
+
+    def __init__(self, label: str, data: dict[str, Any] | str | bytes) -> None:
+        """Wrap a decoded message or a serialized JSON document."""
+        self._label = label
+        self._data = data
+
+    def __str__(self) -> str:
+        """Return the label followed by the message as indented JSON."""
+        data = self._data
+        if isinstance(data, str | bytes):
+            data = orjson.loads(data)
+        dump = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        return f"{self._label}\n{dump}"
+
+
+class _DiscoveryProtocol(asyncio.DatagramProtocol):
+    """Queue UDP discovery responses for discover_printer."""
+
+    def __init__(
+        self, responses: asyncio.Queue[tuple[bytes, tuple[str, int]]], logger: Any
+    ) -> None:
+        """Initialize the discovery protocol."""
+        super().__init__()
+        self.responses = responses
+        self.logger = logger
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Queue a discovery response."""
+        self.responses.put_nowait((data, addr))
 
-    async def _set_response_event(self, request_id: str) -> asyncio.Event:
-        """Set the event for a given request ID."""
-        async with self._response_lock:
-            if event := self._response_events.get(request_id):
-                event.set()
-            elif DEBUG:
-                self.logger.debug("No waiter found for RequestID=%s", request_id)
+    def error_received(self, exc: Exception) -> None:
+        """Log socket errors reported while discovering."""
+        msg = f"Socket error during discovery: {exc}"
+        self.logger.warning(msg)
@@ -7,6 +7,7 @@ import json
 import os
 import re
 import socket
+import time
 from math import floor
 from typing import TYPE_CHECKING, Any
 
@@ -18,6 +19,7 @@ from custom_components.elegoo_printer.const import (
     DEFAULT_FALLBACK_IP,
     DISCOVERY_MESSAGE,
     DISCOVERY_PORT,
+    LOCAL_IP_CACHE_TTL,
     LOGGER,
     PROXY_HOST,
     VIDEO_PORT,
@@ -155,6 +157,8 @@ class ElegooPrinterServer:
         self.runners: list[web.AppRunner] = []
         self._is_connected = False
         self.datagram_transport: asyncio.DatagramTransport | None = None
+        self._local_ip: str | None = None
+        self._local_ip_ts: float = 0.0
 
         if not self.printer.ip_address:
             msg = "Printer IP address is not set. Cannot start proxy server."
@@ -321,13 +325,23 @@ class ElegooPrinterServer:
         return Printer.from_dict(printer_dict)
 
     def get_local_ip(self) -> str:
-        """Determine the local IP address for outbound communication."""
+        """
+        Determine the local IP address for outbound communication.
+
+        The result is cached for LOCAL_IP_CACHE_TTL seconds, as this is called
+        for every proxied message and the route rarely changes.
+        """
+        now = time.monotonic()
+        if self._local_ip and now - self._local_ip_ts < LOCAL_IP_CACHE_TTL:
+            return self._local_ip
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
                 s.connect((self.printer.ip_address or DEFAULT_FALLBACK_IP, 1))
-                return s.getsockname()[0]
+                self._local_ip = s.getsockname()[0]
         except Exception:  # noqa: BLE001
             return PROXY_HOST
+        self._local_ip_ts = now
+        return self._local_ip
 
     def _get_request_headers(
         self, method: str, headers: CIMultiDictProxy[str]
@@ -582,17 +596,16 @@ class ElegooPrinterServer:
         return client_response
 
     def _process_replacements(self, content: str) -> str:
+        local_ip = self.get_local_ip()
         return (
-            content.replace(
-                self.printer.ip_address or DEFAULT_FALLBACK_IP, self.get_local_ip()
-            )
+            content.replace(self.printer.ip_address or DEFAULT_FALLBACK_IP, local_ip)
             .replace(
-                f"{self.get_local_ip()}/",
-                f"{self.get_local_ip()}:{WEBSOCKET_PORT}/",
+                f"{local_ip}/",
+                f"{local_ip}:{WEBSOCKET_PORT}/",
             )
             .replace(
-                f"{self.get_local_ip()}:{VIDEO_PORT}/",
-                f"{self.get_local_ip()}:{WEBSOCKET_PORT}/",
+                f"{local_ip}:{VIDEO_PORT}/",
+                f"{local_ip}:{WEBSOCKET_PORT}/",
             )
             .replace(
                 "${this.webSocketService.hostName}:80",
@@ -640,6 +653,24 @@ class DiscoveryProtocol(asyncio.DatagramProtocol):
         self.printer = printer
         self.proxy_ip = proxy_ip
         self.transport: asyncio.DatagramTransport | None = None
+        # The reply never changes for this proxy, so encode it only once
+        self._response = self._build_response()
+
+    def _build_response(self) -> bytes:
+        """Build the encoded discovery reply advertising this proxy."""
+        response_payload = {
+            "Id": getattr(self.printer, "connection", os.urandom(8).hex()),
+            "Data": {
+                "Name": f"{getattr(self.printer, 'name', 'Elegoo')} Proxy",
+                "MachineName": getattr(self.printer, "name", "Elegoo Proxy"),
+                "BrandName": "Elegoo",
+                "MainboardIP": self.proxy_ip,
+                "MainboardID": getattr(self.printer, "id", "unknown"),
+                "ProtocolVersion": getattr(self.printer, "protocol", "V3.0.0"),
+                "FirmwareVersion": getattr(self.printer, "firmware", "V1.0.0"),
+            },
+        }
+        return json.dumps(response_payload).encode()
 
     def connection_made(self, transport: asyncio.DatagramTransport) -> None:
         """Call when a connection is made."""
@@ -656,21 +687,8 @@ class DiscoveryProtocol(asyncio.DatagramProtocol):
         if message == DISCOVERY_MESSAGE:
             msg = f"Discovery request received from {addr}, responding."
             self.logger.debug(msg)
-            response_payload = {
-                "Id": getattr(self.printer, "connection", os.urandom(8).hex()),
-                "Data": {
-                    "Name": f"{getattr(self.printer, 'name', 'Elegoo')} Proxy",
-                    "MachineName": getattr(self.printer, "name", "Elegoo Proxy"),
-                    "BrandName": "Elegoo",
-                    "MainboardIP": self.proxy_ip,
-                    "MainboardID": getattr(self.printer, "id", "unknown"),
-                    "ProtocolVersion": getattr(self.printer, "protocol", "V3.0.0"),
-                    "FirmwareVersion": getattr(self.printer, "firmware", "V1.0.0"),
-                },
-            }
-            json_string = json.dumps(response_payload)
             if self.transport:
-                self.transport.sendto(json_string.encode(), addr)
+                self.transport.sendto(self._response, addr)
 
     def error_received(self, exc: Exception) -> None:
         """Call when an error is received."""
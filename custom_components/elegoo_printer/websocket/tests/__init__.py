@@ -0,0 +1 @@
+"""Tests for the Elegoo websocket client."""
@@ -0,0 +1,166 @@
+"""Tests for message handling in the Elegoo websocket client."""
+
+import asyncio
+import gc
+import json
+from typing import Any
+from unittest.mock import MagicMock
+
+import aiohttp
+import pytest
+
+from custom_components.elegoo_printer.sdcp.const import CMD_SET_VIDEO_STREAM
+from custom_components.elegoo_printer.websocket.client import ElegooPrinterClient
+
+LATEST_NOZZLE_TEMP = 30.0
+STATUS_BUILDS = 1
+QUEUED_ENTRIES = 2
+
+
+def _client() -> ElegooPrinterClient:
+    """Create a client that is never connected to a printer."""
+    return ElegooPrinterClient(
+        "127.0.0.1", session=MagicMock(spec=aiohttp.ClientSession)
+    )
+
+
+def _status(nozzle_temp: float) -> str:
+    """Build a raw status frame."""
+    return json.dumps(
+        {
+            "Topic": "sdcp/status/ABCDEF",
+            "Status": {"CurrentStatus": [0], "TempOfNozzle": nozzle_temp},
+        }
+    )
+
+
+def _response(request_id: str) -> str:
+    """Build a raw response frame for a command."""
+    return json.dumps(
+        {
+            "Topic": "sdcp/response/ABCDEF",
+            "Data": {"Cmd": 0, "RequestID": request_id, "Data": {"Ack": 0}},
+        }
+    )
+
+
+def test_status_messages_are_coalesced(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that only the newest queued status is built, in order with others."""
+    client = _client()
+    built: list[dict[str, Any]] = []
+    status_handler = client._status_handler  # noqa: SLF001
+
+    def record_status(data: dict[str, Any]) -> None:
+        built.append(data)
+        status_handler(data)
+
+    monkeypatch.setattr(client, "_status_handler", record_status)
+
+    client._enqueue_message(_status(10.0))  # noqa: SLF001
+    client._enqueue_message(_response("abc"))  # noqa: SLF001
+    client._enqueue_message(_status(20.0))  # noqa: SLF001
+    client._enqueue_message(_status(LATEST_NOZZLE_TEMP))  # noqa: SLF001
+
+    assert len(client._rx_queue) == QUEUED_ENTRIES  # noqa: SLF001
+    client._process_rx_queue()  # noqa: SLF001
+
+    assert len(built) == STATUS_BUILDS
+    assert client.printer_data.status.temp_of_nozzle == LATEST_NOZZLE_TEMP
+    assert not client._rx_queue  # noqa: SLF001
+
+
+def test_bad_messages_do_not_drop_responses(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that malformed or failing messages do not strand a pending response."""
+
+    def broken_attributes(_data: dict[str, Any]) -> None:
+        msg = "handler failure"
+        raise ValueError(msg)
+
+    async def run() -> None:
+        client = _client()
+        monkeypatch.setattr(client, "_attributes_handler", broken_attributes)
+        future = asyncio.get_running_loop().create_future()
+        client._pending["abc"] = future  # noqa: SLF001
+
+        client._enqueue_message('{"Topic": "sdcp"}')  # noqa: SLF001
+        client._enqueue_message("[1, 2, 3]")  # noqa: SLF001
+        client._enqueue_message("not json")  # noqa: SLF001
+        client._enqueue_message('{"Topic": "sdcp/attributes/ABCDEF"}')  # noqa: SLF001
+        client._enqueue_message(_response("abc"))  # noqa: SLF001
+        client._process_rx_queue()  # noqa: SLF001
+
+        assert future.done()
+        assert future.result()["Data"]["RequestID"] == "abc"
+
+    asyncio.run(run())
+
+
+def test_failed_video_request_is_consumed_when_callers_cancel(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a video request whose callers all gave up is cleaned up."""
+
+    async def failing_fetch(*, enable: bool) -> None:  # noqa: ARG001
+        await asyncio.sleep(0)
+        msg = "printer went away"
+        raise RuntimeError(msg)
+
+    async def run() -> None:
+        client = _client()
+        monkeypatch.setattr(client, "_fetch_printer_video", failing_fetch)
+        loop = asyncio.get_running_loop()
+        unretrieved: list[dict[str, Any]] = []
+        loop.set_exception_handler(lambda _loop, context: unretrieved.append(context))
+
+        caller = asyncio.create_task(client.get_printer_video(enable=True))
+        await asyncio.sleep(0)
+        inflight = client._video_inflight[True]  # noqa: SLF001
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.wait([inflight])
+        await asyncio.sleep(0)
+
+        assert not client._video_inflight  # noqa: SLF001
+        del inflight
+        gc.collect()
+        assert not unretrieved
+
+    asyncio.run(run())
+
+
+def test_failed_response_handler_fails_its_command(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a response whose handler raises fails the waiting command."""
+
+    def broken_video(_data: dict[str, Any]) -> None:
+        msg = "handler failure"
+        raise ValueError(msg)
+
+    async def run() -> None:
+        client = _client()
+        monkeypatch.setattr(client, "_print_video_handler", broken_video)
+        future = asyncio.get_running_loop().create_future()
+        client._pending["abc"] = future  # noqa: SLF001
+
+        client._enqueue_message(  # noqa: SLF001
+            json.dumps(
+                {
+                    "Topic": "sdcp/response/ABCDEF",
+                    "Data": {
+                        "Cmd": CMD_SET_VIDEO_STREAM,
+                        "RequestID": "abc",
+                        "Data": {"Ack": 0},
+                    },
+                }
+            )
+        )
+        client._process_rx_queue()  # noqa: SLF001
+
+        assert future.done()
+        with pytest.raises(ValueError, match="handler failure"):
+            future.result()
+        assert not client._pending  # noqa: SLF001
+
+    asyncio.run(run())
@@ -35,7 +35,7 @@ async def main() -> None:
             if ping_result:
                 logger.info("✓ Ping successful - printer WebSocket is reachable")
 
-                printer = elegoo_printer.discover_printer(PRINTER_IP)
+                printer = await elegoo_printer.discover_printer(PRINTER_IP)
                 if printer:
                     logger.debug(f"PrinterType: {printer[0].printer_type}")
                     logger.debug(f"Model Reported from Printer: {printer[0].model}")
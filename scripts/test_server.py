@@ -21,6 +21,9 @@ MJPEG_PORT = 3031
 MAINBOARD_ID = "000000000001d354"
 PRINTER_IP = "127.0.0.1"
 
+# Reused for every discovery datagram instead of allocating one per recv
+_RECV_BUF = bytearray(1024)
+
 
 # Printer state
 print_history = {
@@ -337,13 +340,16 @@ async def udp_server(stop_event):
     loop = asyncio.get_running_loop()
     with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
         s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        s.settimeout(1)
+        # Non-blocking so the event loop waits on the socket directly instead
+        # of parking an executor thread in a blocking recv
+        s.setblocking(False)
         s.bind((HOST, UDP_PORT))
         print(f"UDP server listening on {HOST}:{UDP_PORT}")
         while not stop_event.is_set():
             try:
-                data, addr = await loop.run_in_executor(None, s.recvfrom, 1024)
-                if data == b"M99999":
+                async with asyncio.timeout(1):
+                    nbytes, addr = await loop.sock_recvfrom_into(s, _RECV_BUF)
+                if memoryview(_RECV_BUF)[:nbytes] == b"M99999":
                     print(f"Received discovery request from {addr}")
                     response = {
                         "Id": str(uuid.uuid4()),
@@ -357,8 +363,10 @@ async def udp_server(stop_event):
                             "FirmwareVersion": printer_attributes["FirmwareVersion"],
                         },
                     }
-                    s.sendto(json.dumps(response).encode("utf-8"), addr)
-            except socket.timeout:
+                    await loop.sock_sendto(
+                        s, json.dumps(response).encode("utf-8"), addr
+                    )
+            except TimeoutError:
                 continue
     print("UDP server shut down.")
 